@@ -14,11 +14,13 @@ sys.path.append("../../fusion/benchmark")
 
 import argparse
 import os
-import glob
 import logging
 import enum
+import filecmp
 from pathlib import Path
 import re
+import shlex
+import shutil
 import subprocess
 from typing import List, NamedTuple, Optional
 
@@ -54,27 +56,69 @@ Config = NamedTuple(
 GO_WDIR = Path("/tmp/fusion-go")
 
 
+def sort_args(out_path: Path) -> List[str]:
+    """Return the command line of a multithreaded GNU sort that writes its output
+    to out_path. It must run with LC_ALL=C (see SORT_ENV)."""
+    return [
+        "sort",
+        f"--parallel={os.cpu_count() or 1}",
+        "-S",
+        "4G",
+        "-T",
+        str(out_path.parent),
+        "-o",
+        str(out_path),
+    ]
+
+
+# LC_ALL=C makes sort compare bytes, same as the Python fallbacks below.
+SORT_ENV = dict(os.environ, LC_ALL="C")
+
+
 def sort_file(in_path: Path, out_path: Optional[Path]) -> None:
+    """Sort the lines of in_path and write them to out_path, which may be the same
+    as in_path."""
     if out_path is None:
         out_path = Path(str(in_path) + ".sorted")
-    lines = in_path.open().readlines()
+    if shutil.which("sort"):
+        subprocess.check_call(sort_args(out_path) + [str(in_path)], env=SORT_ENV)
+        return
+
+    with in_path.open("rb") as fd:
+        lines = fd.readlines()
     lines.sort()
-    with out_path.open("w") as out:
-        for line in lines:
-            print(line, file=out, end="")
+    with out_path.open("wb") as out:
+        out.writelines(lines)
 
 
 def sort_fasta_headers(in_path: Path, out_path: Path) -> None:
-    lines: List[str] = []
-    for line in in_path.open().readlines():
-        if line.startswith(">"):
-            segments = line.split("|")
-            name_segments = segments[0].split(":")
-            lines.append(name_segments[0] + "|" + "|".join(segments[1:]))
+    """Extract the FASTA header lines, remove the ":xxx" suffix from the read
+    names, and write the sorted headers to out_path.
+
+    Uses grep, sed and a multithreaded GNU sort if they are available.
+    """
+    if all(shutil.which(cmd) for cmd in ["bash", "grep", "sed", "sort"]):
+        # pipefail makes a grep failure (e.g., a missing in_path) fail the
+        # pipeline. grep exits with 1 if there are no headers, which is fine.
+        cmdline = (
+            f"{{ grep '^>' {shlex.quote(str(in_path))} || test $? -eq 1; }}"
+            + r" | sed 's/^\([^:|]*\):[^|]*/\1/'"
+            + " | "
+            + " ".join(shlex.quote(arg) for arg in sort_args(out_path))
+        )
+        logging.info("Run: %s", cmdline)
+        subprocess.check_call(["bash", "-o", "pipefail", "-c", cmdline], env=SORT_ENV)
+        return
+
+    lines: List[bytes] = []
+    with in_path.open("rb") as fd:
+        for line in fd:
+            if line.startswith(b">"):
+                name, _, rest = line.partition(b"|")
+                lines.append(name.partition(b":")[0] + b"|" + rest)
     lines.sort()
-    with out_path.open("w") as out:
-        for line in lines:
-            print(line, file=out, end="")
+    with out_path.open("wb") as out:
+        out.writelines(lines)
 
 
 def go_args(config: Config, gene_list_path: Path, output_suffix: str) -> List[str]:
@@ -105,10 +149,12 @@ def go_args(config: Config, gene_list_path: Path, output_suffix: str) -> List[st
     return args
 
 
+GO_LABEL = "//go/src/github.com/grailbio/bio/cmd/bio-fusion"
+CPP_LABEL = "//bio/rna/fusion:target_rna_fusion"
+
+
 def run_go(args: List[str]) -> None:
-    bin_label = "//go/src/github.com/grailbio/bio/cmd/bio-fusion"
-    util.build([bin_label])
-    bin_path = util.go_executable(bin_label)
+    bin_path = util.go_executable(GO_LABEL)
     logging.info("Start: go: %s %s", bin_path, " ".join(args))
     subprocess.check_call([str(bin_path)] + args)
 
@@ -163,13 +209,25 @@ def cpp_args(config: Config) -> List[str]:
 
 def run_cpp(args: List[str]) -> None:
     CPP_WDIR.mkdir(parents=True, exist_ok=True)
-    bin_label = "//bio/rna/fusion:target_rna_fusion"
-    util.build([bin_label])
-    bin_path = util.nongo_executable(bin_label)
+    util.build([CPP_LABEL])
+    bin_path = util.nongo_executable(CPP_LABEL)
     logging.info("Start: c++: %s %s", bin_path, " ".join(args))
     subprocess.check_call([str(bin_path)] + args)
 
 
+def diff_files(go_path: Path, cpp_path: Path) -> None:
+    """Compare the two files and log the result. The files are first compared
+    byte by byte, and diff is run to show the differences only if they are not
+    identical, since diff is much slower on large files."""
+    try:
+        if filecmp.cmp(go_path, cpp_path, shallow=False):
+            logging.info("%s and %s are identical", go_path, cpp_path)
+            return
+        subprocess.check_call(["diff", go_path, cpp_path])
+    except Exception as e:
+        logging.info(e)
+
+
 # For small tests on adhoc:
 #
 # ./run.py --cosmic_fusion=/tmp/bio-fusion-bench/small/small_pairs.txt --transcript=/tmp/bio-fusion-bench//small/transcriptome.fa --r1=/tmp/bio-fusion-bench//small/smallr1.fastq.gz --r2=/tmp/bio-fusion-bench//small/smallr2.fastq.gz --cache_dir=/tmp/fusion_cache
@@ -210,6 +268,11 @@ def main() -> None:
         update_gene_list=args.update_gene_list,
     )
 
+    # Build the binaries in one bazel invocation, so that bazel can build them
+    # in parallel.
+    labels = {"go": GO_LABEL, "c++": CPP_LABEL}
+    util.build([labels[run] for run in config.run])
+
     output_suffix = "-" + os.path.basename(os.path.splitext(config.r1)[0])
     if not config.cosmic_fusion:
         output_suffix += "-denovo"
@@ -240,38 +303,25 @@ def main() -> None:
         )
 
     if "c++" in config.run:
-        for path in glob.glob(str(CPP_WDIR) + "/*"):
-            logging.info("Remove " + path)
-            os.remove(path)
+        # run_cpp recreates the directory.
+        logging.info("Remove %s", CPP_WDIR)
+        shutil.rmtree(CPP_WDIR, ignore_errors=True)
         run_cpp(cpp_args(config))
         all_fa = list(CPP_WDIR.glob("fusion_[0-9]*.fa"))[0]
         sort_fasta_headers(all_fa, CPP_WDIR / f"all{output_suffix}.fa.sorted")
         filtered_fa = list(CPP_WDIR.glob("*final*[0-9].fa"))[0]
         sort_fasta_headers(filtered_fa, CPP_WDIR / f"filtered{output_suffix}.fa.sorted")
 
-    try:
-        logging.info("Diffing the 1st stage outputs")
-        subprocess.check_call(
-            [
-                "diff",
-                GO_WDIR / f"all{output_suffix}.fa.sorted",
-                CPP_WDIR / f"all{output_suffix}.fa.sorted",
-            ]
-        )
-    except Exception as e:
-        logging.info(e)
-
-    try:
-        logging.info("Diffing the 2nd stage outputs")
-        subprocess.check_call(
-            [
-                "diff",
-                GO_WDIR / f"filtered{output_suffix}.fa.sorted",
-                CPP_WDIR / f"filtered{output_suffix}.fa.sorted",
-            ]
-        )
-    except Exception as e:
-        logging.info(e)
+    logging.info("Diffing the 1st stage outputs")
+    diff_files(
+        GO_WDIR / f"all{output_suffix}.fa.sorted",
+        CPP_WDIR / f"all{output_suffix}.fa.sorted",
+    )
+    logging.info("Diffing the 2nd stage outputs")
+    diff_files(
+        GO_WDIR / f"filtered{output_suffix}.fa.sorted",
+        CPP_WDIR / f"filtered{output_suffix}.fa.sorted",
+    )
 
     logging.info("All done")
 
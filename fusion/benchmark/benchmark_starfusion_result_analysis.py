@@ -2,25 +2,38 @@
 
 import logging
 import argparse
+import multiprocessing
 import os
 import sys
 from pathlib import Path
-from typing import NamedTuple, Any, List, Set
+from typing import NamedTuple, Any, Iterator, List, Set
 
-from simulated_benchmark import GenePair
+from simulated_benchmark import GenePair, gene_pair
 from util import s3_cache_files, REFERENCE_DIR
 
 
 def read_fusion_pair(p: Path) -> Set[GenePair]:
+    """Read the gene pairs in the first column of the TSV file. Header and
+    comment lines are skipped."""
     sorted_targets: Set[GenePair] = set()
-    with open(p) as i_f:
-        for line in i_f:
-            if line.startswith("Gene") or line.startswith("#"):
-                continue
-            sorted_targets.add(GenePair(line.strip().split()[0]))
+    for line in Path(p).read_bytes().splitlines():
+        if not line or line.startswith((b"Gene", b"#")):
+            continue
+        sorted_targets.add(gene_pair(line.split(None, 1)[0].decode()))
     return sorted_targets
 
 
+def find_files(dir: str, pattern: str) -> Iterator[str]:
+    """Yield the paths of the files under dir, recursively, whose names contain
+    pattern. Symlinks to directories are not followed."""
+    with os.scandir(dir) as entries:
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                yield from find_files(e.path, pattern)
+            elif pattern in e.name:
+                yield e.path
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.DEBUG, format="%(asctime)s:%(levelname)s: %(messge)s"
@@ -41,36 +54,33 @@ def main() -> None:
     if not os.path.exists(local_truth_gpair):
         s3_cache_files([REFERENCE_DIR + "/liu_gpair.txt"], args.cache_dir)
 
-    listOfFiles = list()
-    for (dirpath, dirnames, filenames) in os.walk(args.starfusion_dir):
-        listOfFiles += [os.path.join(dirpath, file) for file in filenames]
-
     # get all relevant starfusion result files
-    filtered_results = [
-        f
-        for f in listOfFiles
-        if f.find("star-fusion.fusion_predictions.abridged.tsv") != -1
-    ]
+    filtered_results = list(
+        find_files(args.starfusion_dir, "star-fusion.fusion_predictions.abridged.tsv")
+    )
 
     # compare with truth set
     true_gpairs = read_fusion_pair(local_truth_gpair)
 
     npos = len(true_gpairs)
 
-    for f in filtered_results:
-        print(f)
-        results = read_fusion_pair(f)
+    # The files are parsed in parallel; imap returns them in order.
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        parsed_results = pool.imap(read_fusion_pair, filtered_results)
+        for f, results in zip(filtered_results, parsed_results):
+            print(f)
 
-        npredict = len(results)
-        tp = len(true_gpairs.intersection(results))
-        fn = npos - tp
-        fp = npredict - tp
+            npredict = len(results)
+            tp = len(true_gpairs.intersection(results))
+            fn = npos - tp
+            fp = npredict - tp
 
-        precision = tp / (tp + fp)
-        recall = tp / npos
-        f1 = 2 * precision * recall / (precision + recall)
-        f1 = "%.3f" % (f1)
-        print(f"tp={tp}, fn={fn}, fp={fp}, f1={f1}")
+            precision = tp / (tp + fp)
+            recall = tp / npos
+            f1 = 2 * precision * recall / (precision + recall)
+            f1 = "%.3f" % (f1)
+            print(f"tp={tp}, fn={fn}, fp={fp}, f1={f1}")
 
 
-main()
+if __name__ == "__main__":
+    main()
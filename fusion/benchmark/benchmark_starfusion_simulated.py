@@ -16,10 +16,14 @@ import logging
 from pathlib import Path
 import os
 import sys
-from typing import Any, List, Set
+from typing import Any, Set
 import util
 
-from rna_benchmark import run_starfusion
+from rna_benchmark import (
+    run_starfusion,
+    start_starfusion_container,
+    stop_starfusion_container,
+)
 
 
 def main() -> None:
@@ -49,24 +53,42 @@ def main() -> None:
         default=os.environ["HOME"] + "/STAR-Fusion-v1.5.0.FULL.tar.gz",
         help="Tar.gz file of starfusion source package. https://github.com/STAR-Fusion/STAR-Fusion/wiki#data-resources-required",
     )
+    p.add_argument(
+        "--prefetch_samples",
+        default=1,
+        type=int,
+        help="Number of samples whose FASTQ files are downloaded ahead of the sample being benchmarked",
+    )
+    p.add_argument(
+        "--starfusion_cpus",
+        default=56,
+        type=int,
+        help="Number of threads used by starfusion",
+    )
 
     args = p.parse_args()
 
-    for sample in util.SIMULATED_SAMPLES:
-        util.s3_cache_files([sample.path.r1, sample.path.r2], args.cache_dir)
-        fastq_files: List[str] = []
-        cached_file_pairs: List[util.FASTQPair] = []
-
-        fastq_files += [sample.path.r1, sample.path.r2]
-        cached_file_pairs.append(
-            util.FASTQPair(
-                r1=args.cache_dir + "/" + os.path.basename(sample.path.r1),
-                r2=args.cache_dir + "/" + os.path.basename(sample.path.r2),
-            )
-        )
-        print(cached_file_pairs)
-        sample_name = str(sample.n) + "_" + str(sample.coverage)
-        run_starfusion(sample_name, cached_file_pairs, args)
+    container = start_starfusion_container(args)
+    try:
+        # Download the FASTQ files of the next samples in the background while
+        # starfusion is running on the current one.
+        for sample in util.s3_prefetch(
+            util.SIMULATED_SAMPLES,
+            lambda s: [s.path.r1, s.path.r2],
+            args.cache_dir,
+            args.prefetch_samples,
+        ):
+            cached_file_pairs = [
+                util.FASTQPair(
+                    r1=args.cache_dir + "/" + os.path.basename(sample.path.r1),
+                    r2=args.cache_dir + "/" + os.path.basename(sample.path.r2),
+                )
+            ]
+            print(cached_file_pairs)
+            sample_name = str(sample.n) + "_" + str(sample.coverage)
+            run_starfusion(sample_name, cached_file_pairs, args, container)
+    finally:
+        stop_starfusion_container(container)
 
 
 main()
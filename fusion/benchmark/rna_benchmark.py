@@ -8,76 +8,121 @@ Usage:
 rna_benchmark.py --run={af4,starfusion}
 
 """
-import re
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
-from typing import Any, List, Set
+import shlex
+import shutil
+import subprocess
+import tempfile
+from typing import Any, List, Optional, Tuple
 
 import util
 
 
+STARFUSION_IMAGE = "trinityctat/ctatfusion"
+
+
+def starfusion_docker_mounts(args: Any) -> List[str]:
+    """Return the docker flags for mounting the directories used by starfusion.
+    The directories are created if they don't exist yet."""
+    # dict.fromkeys removes duplicates while keeping the order of the flags.
+    dirs = dict.fromkeys([args.starfusion_data_dir, args.result_dir, args.cache_dir])
+    # Otherwise dockerd creates the missing directories owned by root, and
+    # the benchmark can't write to them later.
+    for dir in dirs:
+        os.makedirs(dir, 0o755, exist_ok=True)
+    return [arg for dir in dirs for arg in ("-v", f"{dir}:{dir}")]
+
+
+def start_starfusion_container(args: Any) -> str:
+    """Start a long-running starfusion container and return its ID.
+
+    Samples are run in the container using "docker exec", so the container
+    startup cost is paid once, not once per sample. The caller must stop the
+    container using stop_starfusion_container.
+    """
+    container = util.check_output(
+        ["docker", "run", "-d", "--rm"]
+        + starfusion_docker_mounts(args)
+        + ["--entrypoint", "sleep", STARFUSION_IMAGE, "infinity"]
+    ).strip()
+    logging.info("Started starfusion container %s", container)
+    return container
+
+
+def stop_starfusion_container(container: str) -> None:
+    try:
+        util.check_call(["docker", "kill", container])
+    except Exception as e:
+        logging.error("Failed to stop starfusion container %s: %s", container, e)
+
+
+def tarball_dir_name(targz_path: str, suffix: str) -> str:
+    """Return the basename of targz_path with the given suffix removed, e.g.,
+    "STAR-Fusion-v1.5.0" for "/home/foo/STAR-Fusion-v1.5.0.FULL.tar.gz" and
+    suffix ".FULL.tar.gz"."""
+    base = os.path.basename(targz_path)
+    if not base.endswith(suffix):
+        raise Exception(f"{targz_path}: expect a file name ending with {suffix}")
+    return base[: -len(suffix)]
+
+
+def extract_targz(targz_path: str, dest_dir: str) -> None:
+    """Extract targz_path under dest_dir. Decompression uses pigz, if available,
+    so that it is spread across all the cores."""
+    if shutil.which("pigz"):
+        util.check_call(
+            ["tar", "--use-compress-program=pigz", "-xf", targz_path, "-C", dest_dir]
+        )
+    else:
+        util.check_call(["tar", "xzf", targz_path, "-C", dest_dir])
+
+
 def run_starfusion(
-    sample_name: str, cached_file_pairs: List[util.FASTQPair], args: Any
+    sample_name: str,
+    cached_file_pairs: List[util.FASTQPair],
+    args: Any,
+    container: Optional[str] = None,
 ):
-    match = re.match(r".*/([^/]+)\.FULL\.tar\.gz$", args.starfusion_targz)
-    assert match
-    local_starfusion_dir = match[1]
+    """Run starfusion on the sample. If container is set, starfusion runs in the
+    given container (see start_starfusion_container). Else, it runs in a new
+    container."""
+    local_starfusion_dir = tarball_dir_name(args.starfusion_targz, ".FULL.tar.gz")
 
     logging.info("LOCAL: %s", local_starfusion_dir)
     if not os.path.exists(os.path.join(args.starfusion_data_dir, local_starfusion_dir)):
-        util.check_call(
-            ["tar", "xzf", args.starfusion_targz, "-C", args.starfusion_data_dir]
-        )
+        extract_targz(args.starfusion_targz, args.starfusion_data_dir)
         util.check_call(
             ["make", "-C", os.path.join(args.starfusion_data_dir, local_starfusion_dir)]
         )
 
-    match = re.match(r".*/([^/]+)\.tar\.gz$", args.starfusion_plug_n_play_targz)
-    assert match
-    local_plugnplay_dir = match[1]
-    if not os.path.exists(args.starfusion_data_dir + local_plugnplay_dir):
-        util.check_call(
-            [
-                "tar",
-                "xzf",
-                args.starfusion_plug_n_play_targz,
-                "-C",
-                args.starfusion_data_dir,
-            ]
-        )
+    local_plugnplay_dir = tarball_dir_name(args.starfusion_plug_n_play_targz, ".tar.gz")
+    if not os.path.exists(os.path.join(args.starfusion_data_dir, local_plugnplay_dir)):
+        extract_targz(args.starfusion_plug_n_play_targz, args.starfusion_data_dir)
 
-    result_dir = args.result_dir + "/" + os.path.basename(sample_name + "-starfusion")
+    result_dir = f"{args.result_dir}/{sample_name}-starfusion"
     logging.info("Start starfusion benchmark: %s", result_dir)
-    try:
-        os.makedirs(result_dir, 0o755)
-    except:
-        logging.error("mkdir %s failed", result_dir)
+    os.makedirs(result_dir, 0o755, exist_ok=True)
 
-    cached_r1 = ",".join(
-        [args.cache_dir + "/" + os.path.basename(fp.r1) for fp in cached_file_pairs]
-    )
-    cached_r2 = ",".join(
-        [args.cache_dir + "/" + os.path.basename(fp.r2) for fp in cached_file_pairs]
-    )
+    cached_r1 = ",".join(fp.r1 for fp in cached_file_pairs)
+    cached_r2 = ",".join(fp.r2 for fp in cached_file_pairs)
 
-    starfusion_args = ["docker", "run"]
-    mounted: Set[str] = set()
-    for dir in [args.starfusion_data_dir, args.result_dir, args.cache_dir]:
-        if dir not in mounted:
-            mounted.add(dir)
-            starfusion_args += ["-v", f"{dir}:{dir}"]
+    if container:
+        starfusion_args = ["docker", "exec", container]
+    else:
+        starfusion_args = ["docker", "run"] + starfusion_docker_mounts(args)
+        starfusion_args += ["--rm", STARFUSION_IMAGE]
     starfusion_args += [
-        "--rm",
-        "trinityctat/ctatfusion",
         os.path.join(args.starfusion_data_dir, local_starfusion_dir, "STAR-Fusion"),
         "--left_fq",
         cached_r1,
         "--right_fq",
         cached_r2,
         "--CPU",
-        "56",
+        str(args.starfusion_cpus),
         "--genome_lib_dir",
         os.path.join(
             args.starfusion_data_dir, local_plugnplay_dir, "ctat_genome_lib_build_dir"
@@ -94,39 +139,83 @@ def run_starfusion(
     logging.info("Finished starfusion benchmark: %s", result_dir)
 
 
-def run_af4(
+def start_fifo_decompressor(
+    gz_paths: List[str], fifo_dir: str, decompressor: str, n_threads: int
+) -> Tuple[List[str], List[subprocess.Popen]]:
+    """Create a named pipe for each of gz_paths and start a process that writes
+    the decompressed contents of the file into the pipe. Each process uses
+    n_threads threads.
+
+    Returns the list of pipe paths and the decompressor processes. The shell
+    blocks in opening the pipe until the reader (af4) opens it.
+    """
+    if decompressor == "rapidgzip":
+        cmd = ["rapidgzip", "-d", "-c", "-P", str(n_threads)]
+    elif decompressor == "pigz":
+        cmd = ["pigz", "-d", "-c", "-p", str(n_threads)]
+    else:
+        raise Exception(f"invalid decompressor: {decompressor}")
+
+    fifo_paths: List[str] = []
+    procs: List[subprocess.Popen] = []
+    for i, gz_path in enumerate(gz_paths):
+        fifo_path = f"{fifo_dir}/{i}-" + os.path.basename(gz_path)[: -len(".gz")]
+        os.mkfifo(fifo_path)
+        cmdline = " ".join(shlex.quote(x) for x in cmd + [gz_path])
+        cmdline += " > " + shlex.quote(fifo_path)
+        logging.info("Run: %s", cmdline)
+        procs.append(subprocess.Popen(["sh", "-c", "exec " + cmdline]))
+        fifo_paths.append(fifo_path)
+    return fifo_paths, procs
+
+
+def run_af4_mode(
     sample_name: str,
-    cached_file_pairs: List[util.FASTQPair],
-    cosmic_fusion_path: str,
+    mode: str,
+    cached_r1: str,
+    cached_r2: str,
+    pprof_port: int,
     args: Any,
-):
-    ref_path = "s3://grail-publications/resources/gencode.v26.whole_genes.fa"
-    util.s3_cache_files([ref_path, cosmic_fusion_path], args.cache_dir)
-
-    cached_r1 = ",".join(
-        [args.cache_dir + "/" + os.path.basename(fp.r1) for fp in cached_file_pairs]
-    )
-    cached_r2 = ",".join(
-        [args.cache_dir + "/" + os.path.basename(fp.r2) for fp in cached_file_pairs]
-    )
-    for mode in ["denovo", "targeted"]:
-        result_dir = args.result_dir + "/" + os.path.basename(sample_name + "-" + mode)
-        if os.path.exists(result_dir + "/filtered.fa"):
-            logging.info("Skipping benchmark: %s", result_dir)
-            continue
-        logging.info("Start af4 benchmark: %s", result_dir)
-        try:
-            os.makedirs(result_dir, 0o755)
-        except:
-            logging.error("mkdir %s failed", result_dir)
+) -> None:
+    """Run af4 once in the given mode ("denovo" or "targeted")."""
+    result_dir = f"{args.result_dir}/{sample_name}-{mode}"
+    if os.path.exists(result_dir + "/filtered.fa"):
+        logging.info("Skipping benchmark: %s", result_dir)
+        return
+    logging.info("Start af4 benchmark: %s", result_dir)
+    os.makedirs(result_dir, 0o755, exist_ok=True)
+    r1, r2 = cached_r1, cached_r2
+    fifo_dir: Optional[str] = None
+    decompressors: List[subprocess.Popen] = []
+    try:
+        if args.fifo_decompressor and not args.decompress_fastq:
+            # Let af4 read plain FASTQ from named pipes fed by a parallel
+            # decompressor.
+            fifo_dir = tempfile.mkdtemp(prefix="af4_fifos")
+            gz_r1, gz_r2 = cached_r1.split(","), cached_r2.split(",")
+            # af4 reads all the pipes at once, and with --parallel_af4_modes
+            # the other mode does too, so the CPUs are split among all of them.
+            n_fifos = len(gz_r1) + len(gz_r2)
+            if args.parallel_af4_modes:
+                n_fifos *= 2
+            n_threads = max(1, (os.cpu_count() or 1) // n_fifos)
+            fifo_r1, procs = start_fifo_decompressor(
+                gz_r1, fifo_dir, args.fifo_decompressor, n_threads
+            )
+            decompressors += procs
+            fifo_r2, procs = start_fifo_decompressor(
+                gz_r2, fifo_dir, args.fifo_decompressor, n_threads
+            )
+            decompressors += procs
+            r1, r2 = ",".join(fifo_r1), ",".join(fifo_r2)
         af4_args = [
             str(util.af4_path()),
             f"-log_dir={result_dir}",
-            f"-pprof=:12345",
+            f"-pprof=:{pprof_port}",
             f"-mutex-profile-rate=1000",
             f"-block-profile-rate=1000",
-            f"-r1={cached_r1}",
-            f"-r2={cached_r2}",
+            f"-r1={r1}",
+            f"-r2={r2}",
             f"-max-genes-per-kmer=2",
             f"-max-proximity-distance=1000",
             f"-max-proximity-genes=5",
@@ -139,8 +228,81 @@ def run_af4(
                 f"-cosmic-fusion={args.cache_dir}/all_pair_art_lod_gpair_merged.txt"
             )
         util.check_call(af4_args)
-        logging.info("Finished benchmark: %s", result_dir)
-        logging.info("Runtime stats: %s", util.run_stats(Path(result_dir)))
+        for proc in decompressors:
+            if proc.wait() != 0:
+                raise Exception(f"{proc.args}: exit status {proc.returncode}")
+    finally:
+        for proc in decompressors:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        if fifo_dir:
+            shutil.rmtree(fifo_dir, ignore_errors=True)
+    logging.info("Finished benchmark: %s", result_dir)
+    logging.info("Runtime stats: %s", util.run_stats(Path(result_dir)))
+
+
+def run_af4(
+    sample_name: str,
+    cached_file_pairs: List[util.FASTQPair],
+    args: Any,
+):
+    cached_r1 = ",".join(fp.r1 for fp in cached_file_pairs)
+    cached_r2 = ",".join(fp.r2 for fp in cached_file_pairs)
+    # Skip the decompression below if both modes have already finished.
+    modes = [
+        mode
+        for mode in ["denovo", "targeted"]
+        if not os.path.exists(f"{args.result_dir}/{sample_name}-{mode}/filtered.fa")
+    ]
+    if not modes:
+        logging.info("Skipping benchmark: %s", sample_name)
+        return
+    decompressed_paths: List[str] = []
+    try:
+        if args.decompress_fastq:
+            # Decompress the FASTQ files once and share them between the denovo
+            # and targeted runs. All the R1 and R2 files are decompressed
+            # concurrently.
+            gz_paths = cached_r1.split(",") + cached_r2.split(",")
+            # Only the files created here are removed below; files left by an
+            # earlier --keep_decompressed run are reused and kept.
+            decompressed_paths = [
+                path[: -len(".gz")]
+                for path in gz_paths
+                if path.endswith(".gz") and not os.path.exists(path[: -len(".gz")])
+            ]
+            paths = util.decompress_fastq_files(gz_paths)
+            n_r1 = len(cached_file_pairs)
+            cached_r1, cached_r2 = ",".join(paths[:n_r1]), ",".join(paths[n_r1:])
+        if args.parallel_af4_modes:
+            # Run the modes concurrently so that their setup phases (reading
+            # the transcriptome, building the kmer index) overlap.
+            util.af4_path()  # build the binary before starting the threads.
+            with ThreadPoolExecutor(max_workers=len(modes)) as executor:
+                futures = [
+                    executor.submit(
+                        run_af4_mode,
+                        sample_name,
+                        mode,
+                        cached_r1,
+                        cached_r2,
+                        12345 + i,
+                        args,
+                    )
+                    for i, mode in enumerate(modes)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for mode in modes:
+                run_af4_mode(sample_name, mode, cached_r1, cached_r2, 12345, args)
+    finally:
+        if not args.keep_decompressed:
+            for path in decompressed_paths:
+                if os.path.exists(path):
+                    logging.info("Remove %s", path)
+                    os.remove(path)
 
 
 def main() -> None:
@@ -176,15 +338,67 @@ def main() -> None:
         default=os.environ["HOME"] + "/STAR-Fusion-v1.5.0.FULL.tar.gz",
         help="Tar.gz file of starfusion source package. https://github.com/STAR-Fusion/STAR-Fusion/wiki#data-resources-required",
     )
+    p.add_argument(
+        "--starfusion_cpus",
+        default=0,
+        type=int,
+        help="Number of threads used by starfusion. If zero, 56 when af4 and starfusion run one after another, 28 when they run concurrently",
+    )
     p.add_argument(
         "--brca_data_dir",
         default="/scratch-nvme/xyang/brca_rnaseq_data",
         help="BT474, KPL4, MCF7, SKBR3 Breast cancer data directory",
     )
+    p.add_argument(
+        "--prefetch_samples",
+        default=1,
+        type=int,
+        help="Number of samples whose FASTQ files are downloaded ahead of the sample being benchmarked",
+    )
+    p.add_argument(
+        "--fifo_decompressor",
+        default="",
+        choices=["", "rapidgzip", "pigz"],
+        help="If set, decompress the FASTQ files with the given parallel decompressor and feed them to af4 through named pipes",
+    )
+    p.add_argument(
+        "--decompress_fastq",
+        action="store_true",
+        help="Decompress the FASTQ files to local disk once and use them for both the denovo and targeted runs",
+    )
+    p.add_argument(
+        "--keep_decompressed",
+        action="store_true",
+        help="Keep the files created by --decompress_fastq so that later invocations can reuse them",
+    )
+    p.add_argument(
+        "--parallel_af4_modes",
+        action="store_true",
+        help="Run af4 in the denovo and targeted modes concurrently",
+    )
+    p.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run af4 and starfusion on a sample one after another. By default they run concurrently",
+    )
 
     args = p.parse_args()
     if not args.run:
         args.run = ["af4", "starfusion"]
+    concurrent = not args.serial and "af4" in args.run and "starfusion" in args.run
+    if not args.starfusion_cpus:
+        args.starfusion_cpus = 28 if concurrent else 56
+
+    # Fetch the reference files of both the brca and the cfrna runs in one
+    # batch, instead of checking them again for every sample.
+    util.s3_cache_files(
+        [
+            "s3://grail-publications/resources/gencode.v26.whole_genes.fa",
+            "s3://grail-publications/2019-ISMB/references/all_art_lod_brca.txt",
+            "s3://grail-publications/2019-ISMB/references/all_pair_art_lod_gpair_merged.txt",
+        ],
+        args.cache_dir,
+    )
 
     ## brca rna-seq for af4
     brca_samples = [
@@ -200,9 +414,8 @@ def main() -> None:
                 ]
             )
 
-    cosmic_fusion_path = (
-        "s3://grail-publications/2019-ISMB/references/all_art_lod_brca.txt"
-    )
+    # af4 reads the brca FASTQ files in place under --brca_data_dir. They are
+    # not copied to --cache_dir.
     for sample in brca_samples:
         r1s: List[str] = []
         for fq in os.listdir(sample):
@@ -215,30 +428,62 @@ def main() -> None:
         print(os.path.basename(sample))
         print(cached_file_pairs)
 
-        run_af4(os.path.basename(sample), cached_file_pairs, cosmic_fusion_path, args)
+        run_af4(os.path.basename(sample), cached_file_pairs, args)
 
     ## cfrna for af4 and starfusion
-    cosmic_fusion_path = (
-        "s3://grail-publications/2019-ISMB/references/all_pair_art_lod_gpair_merged.txt"
-    )
+    samples: List[Tuple[str, List[str], List[util.FASTQPair]]] = []
     for sample in util.RNA_SAMPLES:
-        fastq_files: List[str] = []
-        cached_file_pairs: List[util.FASTQPair] = []
         for fp in sample.paths:
-            assert fp.r1.replace("R1", "R2") == fp.r2, fp.r2
-            fastq_files += [fp.r1, fp.r2]
-            cached_file_pairs.append(
-                util.FASTQPair(
-                    r1=args.cache_dir + "/" + os.path.basename(fp.r1),
-                    r2=args.cache_dir + "/" + os.path.basename(fp.r2),
-                )
+            assert fp.r1.replace("_R1_", "_R2_", 1) == fp.r2, (fp.r1, fp.r2)
+        fastq_files = [path for fp in sample.paths for path in (fp.r1, fp.r2)]
+        cached_file_pairs = [
+            util.FASTQPair(
+                r1=args.cache_dir + "/" + os.path.basename(fp.r1),
+                r2=args.cache_dir + "/" + os.path.basename(fp.r2),
             )
-        util.s3_cache_files(fastq_files, args.cache_dir)
+            for fp in sample.paths
+        ]
+        samples.append((sample.name, fastq_files, cached_file_pairs))
 
-        if "af4" in args.run:
-            run_af4(sample.name, cached_file_pairs, cosmic_fusion_path, args)
-        if "starfusion" in args.run:
-            run_starfusion(sample.name, cached_file_pairs, args)
+    if concurrent:
+        util.af4_path()  # build the binary before starting the threads.
+    # Unless --serial is set, af4 and starfusion run on each sample
+    # concurrently. Starfusion gets half of the CPUs (see --starfusion_cpus).
+    container: Optional[str] = None
+    if "starfusion" in args.run:
+        container = start_starfusion_container(args)
+    try:
+        # The executor is shut down before the container is stopped, so a
+        # starfusion run is never left running against a stopped container.
+        with ThreadPoolExecutor(max_workers=2) as system_executor:
+            # Download the FASTQ files of the next samples in the background
+            # while af4/starfusion is running on the current one.
+            for sample_name, _, cached_file_pairs in util.s3_prefetch(
+                samples, lambda s: s[1], args.cache_dir, args.prefetch_samples
+            ):
+                if concurrent:
+                    futures = [
+                        system_executor.submit(
+                            run_af4, sample_name, cached_file_pairs, args
+                        ),
+                        system_executor.submit(
+                            run_starfusion,
+                            sample_name,
+                            cached_file_pairs,
+                            args,
+                            container,
+                        ),
+                    ]
+                    for future in futures:
+                        future.result()
+                    continue
+                if "af4" in args.run:
+                    run_af4(sample_name, cached_file_pairs, args)
+                if "starfusion" in args.run:
+                    run_starfusion(sample_name, cached_file_pairs, args, container)
+    finally:
+        if container:
+            stop_starfusion_container(container)
 
 
 if __name__ == "__main__":
@@ -2,97 +2,121 @@
 
 import argparse
 import collections
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import mmap
 from pathlib import Path
 import os
-from typing import List, NamedTuple, Optional, Set, Counter
+import re
+from typing import Any, List, NamedTuple, Set, Counter, Tuple
 
 import util
 
 
-class GenePair:
-    def __init__(self, pair: str) -> None:
-        """Arg pair is a two gene names separated by '/' or '--'. For example "EXOSC7/KIAA1328" or EXOSC7--KIAA1328."""
-        g1: str
-        g2: str
-        if "/" in pair:
-            g1, g2 = pair.split("/")
-        else:
-            g1, g2 = pair.split("--")
-        if g1 > g2:
-            g1, g2 = g2, g1
-        self.g1 = g1
-        self.g2 = g2
+# A pair of gene names, in ascending order.
+GenePair = Tuple[str, str]
+
 
-    def __hash__(self):
-        return hash(self.g1) + hash(self.g2)
+def gene_pair(pair: str) -> GenePair:
+    """Arg pair is a two gene names separated by '/' or '--'. For example "EXOSC7/KIAA1328" or EXOSC7--KIAA1328."""
+    g1: str
+    g2: str
+    if "/" in pair:
+        g1, g2 = pair.split("/")
+    else:
+        g1, g2 = pair.split("--")
+    if g1 > g2:
+        return (g2, g1)
+    return (g1, g2)
 
-    def __eq__(self, other) -> bool:
-        return self.__dict__ == other.__dict__
 
+# Matches a FASTA header line of the af4 output and captures the list of gene
+# pairs, e.g. "EXOSC7/KIAA1328" or "EXOSC7/KIAA1328,CLEC3B/KIAA1328".
+FASTA_GENE_PAIRS_RE = re.compile(rb"^>[^|\n]*\|([^|\r\n]*)", re.MULTILINE)
 
 Score = NamedTuple("Score", [("tp", int), ("fp", int), ("fn", int)])
 
 
+def read_targets(input_targets: Path) -> Set[GenePair]:
+    """
+    Reads a target file to return tuples of pairs.
+
+    :param str input_targets: Target file
+    """
+    assert os.path.exists(input_targets), input_targets
+    targets: Set[GenePair] = set()
+    with open(input_targets) as i_f:
+        for line in i_f:
+            if line.startswith("Gene"):
+                continue
+            targets.add(gene_pair(line.split(None, 1)[0]))
+    return targets
+
+
+def read_calls(caller_fa: Path) -> Counter[GenePair]:
+    """Return the number of fragments assigned to each gene pair in the af4
+    FASTA output."""
+    # Count the distinct gene-pair fields of the FASTA headers first, so
+    # that the gene pairs are parsed once per distinct field, not once per
+    # fragment.
+    with open(caller_fa, "rb") as i_f:
+        # mmap fails on an empty file.
+        if os.fstat(i_f.fileno()).st_size > 0:
+            data: Any = mmap.mmap(i_f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = b""
+    field_counts = collections.Counter(FASTA_GENE_PAIRS_RE.findall(data))
+
+    # fragments that have one fusion event called.
+    unique_calls: Counter[GenePair] = collections.Counter()
+
+    # Fragments with >1 fusion event called.  For such fragments, we pick
+    # the the event with the most support and assign the fragment to it.
+    # Each entry is the list of the events and the number of fragments.
+    multi_calls: List[Tuple[List[GenePair], int]] = []
+
+    for field, n in field_counts.items():
+        gene_pairs = field.decode().split(",")
+        if len(gene_pairs) == 1:
+            unique_calls[gene_pair(gene_pairs[0])] += n
+        else:
+            multi_calls.append(([gene_pair(x) for x in gene_pairs], n))
+
+    # Fix the genepair -> frequency counts while assigning multicalls to
+    # unique calls, to make the math order-independent.
+    org_unique_calls = unique_calls.copy()
+    for mc, n in multi_calls:
+        # Counter returns 0 for missing keys. Ties go to the first call.
+        best_call = max(mc, key=org_unique_calls.__getitem__)
+        unique_calls[best_call] += org_unique_calls[best_call] * n
+
+    return unique_calls
+
+
 class TargetedFusionStats:
-    def __init__(self, input_targets: Path, caller_fa: Path) -> None:
+    def __init__(self, targets: Set[GenePair], caller_fa: Path, cache_dir: str) -> None:
         """
-        Reads a target file to return tuples of pairs.
-
-        :param str input_targets: Target file
+        :param targets: Target gene pairs, as returned by read_targets.
+        :param caller_fa: FASTA output of af4.
+        :param cache_dir: Directory where the parsed calls are cached.
         """
-        assert os.path.exists(input_targets), input_targets
         assert os.path.exists(caller_fa), caller_fa
-        self.sorted_targets: Set[GenePair] = set()
-        with open(input_targets) as i_f:
-            for line in i_f:
-                if line.startswith("Gene"):
-                    continue
-                gp = GenePair(line.strip().split()[0])
-                self.sorted_targets.add(GenePair(line.strip().split()[0]))
-
+        self.sorted_targets = targets
         self.sorted_fixed_targets = self.sorted_targets.copy()
         # logging.info('Adding reference gene pairs %s', self.sorted_fixed_targets)
 
         # KIAA1328/EXO7C manifests as KIAA1328/CLEC3B
-        self.sorted_fixed_targets.remove(GenePair("EXOSC7/KIAA1328"))
-        self.sorted_fixed_targets.add(GenePair("CLEC3B/KIAA1328"))
+        self.sorted_fixed_targets.remove(gene_pair("EXOSC7/KIAA1328"))
+        self.sorted_fixed_targets.add(gene_pair("CLEC3B/KIAA1328"))
         # STAG3L1 is a pseudogene of STAG3
-        self.sorted_fixed_targets.remove(GenePair("CCDC88C/STAG3L1"))
-        self.sorted_fixed_targets.add(GenePair("CCDC88C/STAG3"))
-
-        # fragments that have one fusion event called.
-        unique_calls: Counter[GenePair] = collections.Counter()
-
-        # Fragments with >1 fusion event called.  For such fragments, we pick
-        # the the event with the most support and assign the fragment to it.
-        multi_calls: List[List[GenePair]] = []
-
-        with open(caller_fa) as i_f:
-            for line in i_f:
-                if line.startswith(">"):
-                    gene_pairs = line.strip().split("|")[1].split(",")
-                    if len(gene_pairs) == 1:
-                        unique_calls[GenePair(gene_pairs[0])] += 1
-                    else:
-                        multi_calls.append([GenePair(x) for x in gene_pairs])
-
-        # Fix the genepair -> frequency counts while assigning multicalls to
-        # unique calls, to make the math order-independent.
-        org_unique_calls = unique_calls.copy()
-        for mc in multi_calls:
-            best_count = -1
-            best_call: Optional[GenePair] = None
-
-            for gp in mc:
-                freq = org_unique_calls.get(gp, 0)
-                if freq > best_count:
-                    best_count = freq
-                    best_call = gp
-            assert best_call
-            unique_calls[best_call] += best_count
-
-        self.calls = unique_calls
+        self.sorted_fixed_targets.remove(gene_pair("CCDC88C/STAG3L1"))
+        self.sorted_fixed_targets.add(gene_pair("CCDC88C/STAG3"))
+
+        # The parsed calls are cached in cache_dir, for rescoring the same af4
+        # output.
+        self.calls: Counter[GenePair] = util.cached_parse(
+            caller_fa, read_calls, cache_dir
+        )
 
     def stats(self, threshold=2) -> Score:
         """
@@ -112,6 +136,12 @@ class TargetedFusionStats:
         return Score(tp=tp, fn=fn, fp=fp)
 
 
+def compute_stats(targets: Set[GenePair], result_dir: str, cache_dir: str) -> Score:
+    """Score the af4 output in result_dir against the truth gene pairs."""
+    stats = TargetedFusionStats(targets, Path(f"{result_dir}/filtered.fa"), cache_dir)
+    return stats.stats()
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.DEBUG, format="%(asctime)s:%(levelname)s: %(message)s"
@@ -134,6 +164,12 @@ def main() -> None:
         action="store_true",
         help="Always copy benchmark data files, even if they already exist locally.",
     )
+    p.add_argument(
+        "--prefetch_samples",
+        default=1,
+        type=int,
+        help="Number of samples whose FASTQ files are downloaded ahead of the sample being benchmarked",
+    )
     args = p.parse_args()
     util.s3_cache_files(
         [
@@ -144,23 +180,31 @@ def main() -> None:
         ],
         args.cache_dir,
     )
+    # (mode, sample, result_dir) of each af4 run.
+    jobs: List[Tuple[str, util.SimulatedSample, str]] = []
     for mode in ["denovo", "targeted"]:
-        for sample in util.SIMULATED_SAMPLES:
-            util.s3_cache_files([sample.path.r1, sample.path.r2], args.cache_dir)
+        # Download the FASTQ files of the next samples in the background while
+        # af4 is running on the current one.
+        for sample in util.s3_prefetch(
+            util.SIMULATED_SAMPLES,
+            lambda s: [s.path.r1, s.path.r2],
+            args.cache_dir,
+            args.prefetch_samples,
+        ):
             result_dir = (
                 f"{args.result_dir}/synthetic-{mode}-{sample.n}-{sample.coverage}"
             )
-            try:
-                os.makedirs(result_dir, 0o755)
-            except:
-                logging.error("mkdir %s failed", result_dir)
+            os.makedirs(result_dir, 0o755, exist_ok=True)
             if not os.path.exists(f"{result_dir}/filtered.fa") or args.rerun_af4:
                 logging.info("running benchmark in %s", result_dir)
+                cached_r1, cached_r2 = util.cached_fastq_csv(
+                    [sample.path], args.cache_dir
+                )
                 af4_args = [
                     str(util.af4_path()),
                     f"-log_dir={result_dir}",
-                    f"-r1={args.cache_dir}/{sample.path.r1}",
-                    f"-r2={args.cache_dir}/{sample.path.r2}",
+                    f"-r1={cached_r1}",
+                    f"-r2={cached_r2}",
                     f"-fasta-output={result_dir}/all.fa",
                     f"-filtered-output={result_dir}/filtered.fa",
                     f"-max-genes-per-kmer=2",
@@ -179,12 +223,20 @@ def main() -> None:
                 util.check_call(af4_args)
                 logging.info("Runtime stats: %s", util.run_stats(Path(result_dir)))
 
-            stats = TargetedFusionStats(
-                Path(f"{args.cache_dir}/liu_gpair.txt"),
-                Path(f"{result_dir}/filtered.fa"),
-            )
-
-            s = stats.stats()
+            jobs.append((mode, sample, result_dir))
+
+    # Parsing filtered.fa is pure Python, so the samples are scored in separate
+    # processes once all the af4 runs are done.
+    # The truth set is the same for all the samples, so it is read only once.
+    targets = read_targets(Path(f"{args.cache_dir}/liu_gpair.txt"))
+    with ProcessPoolExecutor() as ex:
+        scores = ex.map(
+            compute_stats,
+            [targets] * len(jobs),
+            [j[2] for j in jobs],
+            [args.cache_dir] * len(jobs),
+        )
+        for (mode, sample, _), s in zip(jobs, scores):
             tp = "%d" % (s.tp,)
             fp = "%d" % (s.fp,)
             fn = "%d" % (s.fn,)
@@ -2,14 +2,14 @@
 
 """This script splits one large fastq files into multiple smaller ones."""
 
-import glob
 import logging
 import sys
 import os
 import re
+import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Iterator, List, Optional
 
 # FASTQ files to split.
 files = [
@@ -33,24 +33,116 @@ files = [
 dest_dir = "s3://grail-ysaito/af4_benchmark"
 
 
+# Number of FASTQ files split concurrently. The decompressor and the compressor
+# of each split use threads_per_split threads each.
+max_parallel_splits = 4
+threads_per_split = max(1, (os.cpu_count() or 1) // max_parallel_splits)
+
+# Uploads the shards of all the files.
+upload_pool = ThreadPoolExecutor(8)
+
+
 def main():
-    pool = ThreadPoolExecutor(64)
     logging.basicConfig(level=logging.DEBUG)
-    results = []
-    for fastq_path in files:
-        results.append(pool.submit(split_fastq, fastq_path))
-    for r in results:
-        print(r.result())
+    pool = ThreadPoolExecutor(max_parallel_splits)
+    splits = [pool.submit(split_fastq, fastq_path) for fastq_path in files]
+    uploads: List[Future] = []
+    for r in as_completed(splits):
+        uploads += r.result()
+    for r in as_completed(uploads):
+        r.result()
+
 
+# Number of lines in each shard. It must be a multiple of four so that a FASTQ
+# record is never split across shards.
+shard_lines = 209715200
 
-def gzip_and_upload(path: str):
-    subprocess.check_call(["gzip", path])
+
+def upload(path: str):
     subprocess.check_call(
-        ["grail-file", "cp", path, dest_dir + "/" + os.path.basename(path) + ".gz"]
+        ["grail-file", "cp", path, dest_dir + "/" + os.path.basename(path)]
     )
 
 
-def split_fastq(s3_fastq_path: str) -> None:
+def decompress_command(path: str) -> List[str]:
+    """Return the command that writes the decompressed contents of the gzip file
+    to stdout. Parallel decompressors are preferred, since a single-threaded
+    zcat caps the throughput of the split."""
+    n_threads = str(threads_per_split)
+    if shutil.which("rapidgzip"):
+        return ["rapidgzip", "-d", "-c", "-P", n_threads, path]
+    if shutil.which("igzip"):
+        return ["igzip", "-d", "-c", "-T", n_threads, path]
+    if shutil.which("pigz"):
+        return ["pigz", "-d", "-c", path]
+    return ["gzip", "-d", "-c", path]
+
+
+def compress_command() -> List[str]:
+    """Return the command that gzips stdin to stdout."""
+    if shutil.which("pigz"):
+        return ["pigz", "-c", "-p", str(threads_per_split)]
+    return ["gzip", "-c"]
+
+
+def write_shards(in_fd: BinaryIO, basename: str) -> Iterator[str]:
+    """Split the contents of in_fd into files "<basename>-NN.fastq.gz" of
+    shard_lines lines each, NN=00,01,... The shards are compressed as they are
+    written, so the uncompressed data never hits the disk. Yields the path of
+    each shard once it is complete."""
+
+    def finish(sink: subprocess.Popen, out: BinaryIO):
+        sink.stdin.close()
+        if sink.wait() != 0:
+            raise Exception(f"{sink.args}: exit status {sink.returncode}")
+        out.close()
+
+    shard = 0
+    remaining = shard_lines
+    sink: Optional[subprocess.Popen] = None
+    try:
+        while True:
+            buf = in_fd.read(64 << 20)
+            if not buf:
+                break
+            while buf:
+                if not sink:
+                    path = f"{basename}-{shard:02d}.fastq.gz"
+                    logging.info("Write %s", path)
+                    out = open(path, "wb")
+                    sink = subprocess.Popen(
+                        compress_command(), stdin=subprocess.PIPE, stdout=out
+                    )
+                n_lines = buf.count(b"\n")
+                if n_lines < remaining:
+                    sink.stdin.write(buf)
+                    remaining -= n_lines
+                    break
+                # The shard ends in this buffer.
+                pos = -1
+                for _ in range(remaining):
+                    pos = buf.find(b"\n", pos + 1)
+                sink.stdin.write(buf[: pos + 1])
+                buf = buf[pos + 1 :]
+                finish(sink, out)
+                sink = None
+                yield path
+                shard += 1
+                remaining = shard_lines
+        if sink:
+            finish(sink, out)
+            sink = None
+            yield path
+    finally:
+        if sink:
+            sink.kill()
+            sink.wait()
+            out.close()
+
+
+def split_fastq(s3_fastq_path: str) -> List[Future]:
+    """Split the FASTQ file into shards and upload them to dest_dir. Returns the
+    uploads, which run on upload_pool and may still be in progress."""
     fastq_path = os.path.basename(s3_fastq_path)
     if not os.path.exists(fastq_path):
         logging.info("cp %s -> %s", s3_fastq_path, fastq_path)
@@ -61,20 +153,20 @@ def split_fastq(s3_fastq_path: str) -> None:
         m = re.match("([^/]+).fastq.gz", fastq_path)
     assert m, fastq_path
     basename = m[1]
-    cmdline = f"zcat {fastq_path} | split -d -l 209715200 - {basename}-"
-    logging.info("Run: %s", cmdline)
-    subprocess.check_call(cmdline, shell=True)
-    pool = ThreadPoolExecutor(64)
-
-    results: Any = []
-    for split_shard_path in glob.glob(basename + "-[0-9][0-9]"):
-        fastq_shard_path = split_shard_path + ".fastq"
-        os.rename(split_shard_path, fastq_shard_path)
-        results.append(pool.submit(gzip_and_upload, fastq_shard_path))
-        # results.append(pool.submit(subprocess.check_call, ['gzip', fastq_shard_path]))
-
-    for r in results:
-        print(r.result())
+    decompress_args = decompress_command(fastq_path)
+    logging.info("Run: %s", " ".join(decompress_args))
+    decompressor = subprocess.Popen(decompress_args, stdout=subprocess.PIPE)
+    # Upload the shards while the following ones are being written.
+    uploads: List[Future] = []
+    try:
+        for shard_path in write_shards(decompressor.stdout, basename):
+            uploads.append(upload_pool.submit(upload, shard_path))
+    finally:
+        decompressor.stdout.close()
+        decompressor.wait()
+    if decompressor.returncode != 0:
+        raise Exception(f"{decompress_args}: exit status {decompressor.returncode}")
+    return uploads
 
 
 main()
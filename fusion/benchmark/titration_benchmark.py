@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
-import glob
 import argparse
 import collections
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import os
@@ -23,60 +23,88 @@ def main() -> None:
     p.add_argument(
         "--result_dir", default=util.DEFAULT_RESULT_DIR, help="Benchmark result dir"
     )
+    p.add_argument(
+        "--prefetch_samples",
+        default=1,
+        type=int,
+        help="Number of samples whose FASTQ files are downloaded ahead of the sample being benchmarked",
+    )
+    p.add_argument(
+        "--decompress_fastq",
+        action="store_true",
+        help="Decompress the FASTQ files of each sample in parallel with pigz before running af4",
+    )
     args = p.parse_args()
 
-    util.s3_cache_files(
-        [
-            util.REFERENCE_DIR + "/gencode.v26.whole_genes.fa",
-            util.REFERENCE_DIR + "/all_pair_art_lod_gpair_merged.txt",
-        ],
-        args.cache_dir,
-    )
+    samples: List[util.TitrationSample] = []
     for sample in util.TITRATION_SAMPLES:
-        logging.info("Start benchmark %s", sample.name)
-        result_dir = args.result_dir + "/" + sample.name
-        try:
-            os.makedirs(result_dir, 0o755)
-        except:
-            logging.error("mkdir %s failed", result_dir)
-        if os.path.exists(result_dir + "/filtered.fa"):
-            logging.info("Skip %s", result_dir)
+        if os.path.exists(f"{args.result_dir}/{sample.name}/filtered.fa"):
+            logging.info("Skip %s", sample.name)
             continue
-        util.s3_cache_files(util.expand_fastq_files(sample.paths), args.cache_dir)
-        cached_r1 = ",".join(
-            [args.cache_dir + "/" + os.path.basename(fq.r1) for fq in sample.paths]
-        )
-        cached_r2 = ",".join(
-            [args.cache_dir + "/" + os.path.basename(fq.r2) for fq in sample.paths]
+        samples.append(sample)
+
+    util.grail_file_path()  # build the binary before starting the threads.
+    with ThreadPoolExecutor(max_workers=1) as reference_executor:
+        reference_fetch = reference_executor.submit(
+            util.s3_cache_files,
+            [
+                util.REFERENCE_DIR + "/gencode.v26.whole_genes.fa",
+                util.REFERENCE_DIR + "/all_pair_art_lod_gpair_merged.txt",
+            ],
+            args.cache_dir,
         )
-        cached_ref = args.cache_dir + "/gencode.v26.whole_genes.fa"
-        cached_cosmic_fusion = args.cache_dir + "/all_pair_art_lod_gpair_merged.txt"
+        # Download the FASTQ files of the next samples in the background while af4
+        # is running on the current one.
+        for sample in util.s3_prefetch(
+            samples,
+            lambda s: util.expand_fastq_files(s.paths),
+            args.cache_dir,
+            args.prefetch_samples,
+        ):
+            logging.info("Start benchmark %s", sample.name)
+            result_dir = f"{args.result_dir}/{sample.name}"
+            os.makedirs(result_dir, 0o755, exist_ok=True)
+            reference_fetch.result()
+            cached_r1, cached_r2 = util.cached_fastq_csv(sample.paths, args.cache_dir)
+            # Files to remove once the sample is done.
+            sample_files = cached_r1.split(",") + cached_r2.split(",")
+            if args.decompress_fastq:
+                # af4 otherwise decompresses each gzip file with a single thread.
+                # All the R1 and R2 files are decompressed concurrently.
+                paths = util.decompress_fastq_files(sample_files)
+                n_r1 = len(sample.paths)
+                cached_r1, cached_r2 = ",".join(paths[:n_r1]), ",".join(paths[n_r1:])
+                sample_files += paths
+            cached_ref = args.cache_dir + "/gencode.v26.whole_genes.fa"
+            cached_cosmic_fusion = args.cache_dir + "/all_pair_art_lod_gpair_merged.txt"
 
-        af4_args = [
-            str(util.af4_path()),
-            f"-log_dir={result_dir}",
-            f"-pprof=:12345",
-            f"-mutex-profile-rate=1000",
-            f"-block-profile-rate=1000",
-            f"-r1={cached_r1}",
-            f"-r2={cached_r2}",
-            f"-fasta-output={result_dir}/all.fa",
-            f"-filtered-output={result_dir}/filtered.fa",
-            f"-transcript={cached_ref}",
-            f"-max-genes-per-kmer=2",
-            f"-max-proximity-distance=1000",
-            f"-max-proximity-genes=5",
-            f"-unstranded-prep",
-            f"-cosmic-fusion={cached_cosmic_fusion}",
-        ]
-        util.check_call(af4_args)
-        logging.info("Finished benchmark %d: %s", sample.name)
-        logging.info("Runtime stats: %s", util.run_stats(Path(result_dir)))
-        for path in glob.glob(f"{args.cache_dir}/*rerun*"):
-            try:
-                os.remove(path)
-            except:
-                logging.error("failed to remove " + path)
+            af4_args = [
+                str(util.af4_path()),
+                f"-log_dir={result_dir}",
+                f"-pprof=:12345",
+                f"-mutex-profile-rate=1000",
+                f"-block-profile-rate=1000",
+                f"-r1={cached_r1}",
+                f"-r2={cached_r2}",
+                f"-fasta-output={result_dir}/all.fa",
+                f"-filtered-output={result_dir}/filtered.fa",
+                f"-transcript={cached_ref}",
+                f"-max-genes-per-kmer=2",
+                f"-max-proximity-distance=1000",
+                f"-max-proximity-genes=5",
+                f"-unstranded-prep",
+                f"-cosmic-fusion={cached_cosmic_fusion}",
+            ]
+            util.check_call(af4_args)
+            logging.info("Finished benchmark: %s", result_dir)
+            logging.info("Runtime stats: %s", util.run_stats(Path(result_dir)))
+            # Remove only this sample's files; the next samples' files may already
+            # be in the cache.
+            for path in sample_files:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logging.error("failed to remove %s: %s", path, e)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,29 @@
+import hashlib
+import inspect
 import logging
-import glob
+import mmap
 import os
+import pickle
 import subprocess
 import re
+import shutil
+import tempfile
 import itertools
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, NamedTuple, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 # The local directory to download the S3 files.
 DEFAULT_CACHE_DIR = "/scratch-nvme/cache_tmp"
@@ -72,393 +90,58 @@ TitrationSample = NamedTuple(
     "TitrationSample", [("name", str), ("paths", List[FASTQPair])]
 )
 
+
+def lane_fastq_pairs(dir: str, prefix: str, lanes: Iterable[int]) -> List[FASTQPair]:
+    """Return the FASTQ pairs of a sample sequenced on multiple lanes. The files
+    are named <dir>/<prefix>_L<lane>_R{1,2}_001.fastq.gz, where <lane> is
+    zero-padded to three digits."""
+    return [
+        FASTQPair(
+            r1=f"{dir}/{prefix}_L{lane:03d}_R1_001.fastq.gz",
+            r2=f"{dir}/{prefix}_L{lane:03d}_R2_001.fastq.gz",
+        )
+        for lane in lanes
+    ]
+
+
+def shard_fastq_pairs(dir: str, prefix: str, n_shards: int) -> List[FASTQPair]:
+    """Return the FASTQ pairs created by split_fastq.py. The files are named
+    <dir>/<prefix>_R{1,2}_001-<shard>.fastq.gz, where <shard> is 00, 01, ..."""
+    return [
+        FASTQPair(
+            r1=f"{dir}/{prefix}_R1_001-{shard:02d}.fastq.gz",
+            r2=f"{dir}/{prefix}_R2_001-{shard:02d}.fastq.gz",
+        )
+        for shard in range(n_shards)
+    ]
+
+
 # Files used in the titration benchmarks (grail-internal location)
 ORG_TITRATION_SAMPLES = [
     TitrationSample(
-        name="170206_ARTLoD_B1_01rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_01rerun/170206_ARTLoD_B1_01rerun_S1_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    TitrationSample(
-        name="170206_ARTLoD_B1_02rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_02rerun/170206_ARTLoD_B1_02rerun_S1_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    # TitrationSample(name='170206_ARTLoD_B1_03rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_03rerun/170206_ARTLoD_B1_03rerun_S1_L008_R2_001.fastq.gz'),
-    # ]),
-    TitrationSample(
-        name="170206_ARTLoD_B1_04rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_04rerun/170206_ARTLoD_B1_04rerun_S1_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    # TitrationSample(name='170206_ARTLoD_B1_05rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_05rerun/170206_ARTLoD_B1_05rerun_S2_L008_R2_001.fastq.gz'),
-    # ]),
-    # TitrationSample(name='170206_ARTLoD_B1_06rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_06rerun/170206_ARTLoD_B1_06rerun_S2_L008_R2_001.fastq.gz'),
-    # ]),
-    TitrationSample(
-        name="170206_ARTLoD_B1_07rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_07rerun/170206_ARTLoD_B1_07rerun_S2_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    # TitrationSample(name='170206_ARTLoD_B1_08rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0034_BHCL2WALXX/2255989125/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_08rerun/170206_ARTLoD_B1_08rerun_S2_L008_R2_001.fastq.gz'),
-    # ]),
-    # TitrationSample(name='170206_ARTLoD_B1_09rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_09rerun/170206_ARTLoD_B1_09rerun_S3_L008_R2_001.fastq.gz'),
-    # ]),
-    TitrationSample(
-        name="170206_ARTLoD_B1_10rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_10rerun/170206_ARTLoD_B1_10rerun_S3_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    # TitrationSample(name='170206_ARTLoD_B1_11rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_11rerun/170206_ARTLoD_B1_11rerun_S3_L008_R2_001.fastq.gz'),
-    # ]),
-    # TitrationSample(name='170206_ARTLoD_B1_12rerun', paths=[
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L001_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L002_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L003_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L004_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L005_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L006_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L007_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L008_R1_001.fastq.gz',
-    #               r2='s3://grail-clinical-fastq/MenloPark/170214_E00543_0033_AHCLLKALXX/2738376149/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_12rerun/170206_ARTLoD_B1_12rerun_S4_L008_R2_001.fastq.gz'),
-    # ]),
-    TitrationSample(
-        name="170206_ARTLoD_B1_13rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00543_0034_BHCLJVALXX/2291556533/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_13rerun/170206_ARTLoD_B1_13rerun_S4_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
-    TitrationSample(
-        name="170206_ARTLoD_B1_14rerun",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L001_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L002_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L003_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L004_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L005_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L006_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L007_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L008_R1_001.fastq.gz",
-                r2="s3://grail-clinical-fastq/MenloPark/170214_E00564_0033_AHCWC7ALXX/3447259045/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/170206_ARTLoD_B1_14rerun/170206_ARTLoD_B1_14rerun_S4_L008_R2_001.fastq.gz",
-            ),
-        ],
-    ),
+        name=name,
+        paths=lane_fastq_pairs(
+            f"s3://grail-clinical-fastq/MenloPark/{run}/bcl2fastq-2.19.1.403-umi-1mismatch-noignore/{name}",
+            f"{name}_{sample_number}",
+            range(1, 9),
+        ),
+    )
+    for name, run, sample_number in [
+        ("170206_ARTLoD_B1_01rerun", "170214_E00543_0033_AHCLLKALXX/2738376149", "S1"),
+        ("170206_ARTLoD_B1_02rerun", "170214_E00543_0034_BHCLJVALXX/2291556533", "S1"),
+        # ("170206_ARTLoD_B1_03rerun", "170214_E00564_0033_AHCWC7ALXX/3447259045", "S1"),
+        ("170206_ARTLoD_B1_04rerun", "170214_E00564_0034_BHCL2WALXX/2255989125", "S1"),
+        # ("170206_ARTLoD_B1_05rerun", "170214_E00543_0033_AHCLLKALXX/2738376149", "S2"),
+        # ("170206_ARTLoD_B1_06rerun", "170214_E00543_0034_BHCLJVALXX/2291556533", "S2"),
+        ("170206_ARTLoD_B1_07rerun", "170214_E00564_0033_AHCWC7ALXX/3447259045", "S2"),
+        # ("170206_ARTLoD_B1_08rerun", "170214_E00564_0034_BHCL2WALXX/2255989125", "S2"),
+        # ("170206_ARTLoD_B1_09rerun", "170214_E00543_0033_AHCLLKALXX/2738376149", "S3"),
+        ("170206_ARTLoD_B1_10rerun", "170214_E00543_0034_BHCLJVALXX/2291556533", "S3"),
+        # ("170206_ARTLoD_B1_11rerun", "170214_E00564_0033_AHCWC7ALXX/3447259045", "S3"),
+        # ("170206_ARTLoD_B1_12rerun", "170214_E00543_0033_AHCLLKALXX/2738376149", "S4"),
+        ("170206_ARTLoD_B1_13rerun", "170214_E00543_0034_BHCLJVALXX/2291556533", "S4"),
+        ("170206_ARTLoD_B1_14rerun", "170214_E00564_0033_AHCWC7ALXX/3447259045", "S4"),
+    ]
 ]
 
 # Files used in the titration benchmarks (public location)
@@ -482,205 +165,57 @@ RNASample = NamedTuple(
     "RNASample", [("name", str), ("paths", List[FASTQPair])]  # sample name
 )  # FASTQ files
 
+# Directory of the FASTQ files created by running split_fastq.py on the original
+# FASTQ pairs.
+SPLIT_FASTQ_DIR = "s3://grail-ysaito/af4_benchmark"
+
 # Files used in the RNA benchmarks (grail-internal location)
 ORG_RNA_SAMPLES = [
     RNASample(
         name="101CPREL277",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L001_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L001_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L002_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L002_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L003_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L003_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L004_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L004_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L005_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L005_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L006_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L006_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L007_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L007_R2_001.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L008_R1_001.fastq.gz",
-                r2="s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277/101CPREL277_S1_L008_R2_001.fastq.gz",
-            ),
-        ],
+        paths=lane_fastq_pairs(
+            "s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/101CPREL277",
+            "101CPREL277_S1",
+            range(1, 9),
+        ),
     ),
-    # Note: the following filepair is the original. Files in s3://grail-ysaito/af4_benchmark are created by running split_fastq.py on the original fastq pair.
+    # Note: the original of the following samples is the lane in
+    # s3://grail-cfrna-fastq/MissionBay/<run>/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/<name>/,
+    # where (name, run) is
     #
-    # FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0049_AHCYJYALXX/3747505862/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/108CPREL315/108CPREL315_S4_L004_R1_001.fastq.gz',
-    #         r2='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0049_AHCYJYALXX/3747505862/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/108CPREL315/108CPREL315_S4_L004_R2_001.fastq.gz')],
+    # 108CPREL315: 161206_E00501_0049_AHCYJYALXX/3747505862
+    # 74HPREL332: 170105_K00215_0113_AHF2N2BBXX/3062013994
+    # 118HPREL322: 161206_E00501_0050_BHF2JCALXX/590215334
+    # 53HPREL160: 160927_K00122_0179_BHFWLKBBXX/3600619798
+    # 117HPREL321: 161206_E00501_0050_BHF2JCALXX/590215334
     RNASample(
         name="108CPREL315",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-00.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-00.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-01.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-01.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-02.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-02.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-03.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-03.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-04.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-04.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-05.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-05.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-06.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-06.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-07.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-07.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R1_001-08.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/108CPREL315_S4_L004_R2_001-08.fastq.gz",
-            ),
-        ],
+        paths=shard_fastq_pairs(SPLIT_FASTQ_DIR, "108CPREL315_S4_L004", 9),
     ),
-    # FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/170105_K00215_0113_AHF2N2BBXX/3062013994/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/74HPREL332/74HPREL332_S1_L001_R1_001.fastq.gz',
-    #         r2='s3://grail-cfrna-fastq/MissionBay/170105_K00215_0113_AHF2N2BBXX/3062013994/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/74HPREL332/74HPREL332_S1_L001_R2_001.fastq.gz')],
     RNASample(
         name="74HPREL332",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R1_001-00.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R2_001-00.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R1_001-01.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R2_001-01.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R1_001-02.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R2_001-02.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R1_001-03.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/74HPREL332_S1_L001_R2_001-03.fastq.gz",
-            ),
-        ],
+        paths=shard_fastq_pairs(SPLIT_FASTQ_DIR, "74HPREL332_S1_L001", 4),
     ),
     RNASample(
         name="118HPREL322",
-        paths=[
-            # FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0050_BHF2JCALXX/590215334/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/118HPREL322/118HPREL322_S3_L003_R1_001.fastq.gz',
-            #        r2='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0050_BHF2JCALXX/590215334/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/118HPREL322/118HPREL322_S3_L003_R2_001.fastq.gz')],
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-00.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-00.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-01.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-01.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-02.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-02.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-03.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-03.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-04.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-04.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-05.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-05.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-06.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-06.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R1_001-07.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/118HPREL322_S3_L003_R2_001-07.fastq.gz",
-            ),
-        ],
+        paths=shard_fastq_pairs(SPLIT_FASTQ_DIR, "118HPREL322_S3_L003", 8),
     ),
-    # RNASample(name='68HPREL273', paths=[
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L001_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L001_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L002_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L002_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L003_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L003_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L004_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L004_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L005_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L005_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L006_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L006_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L007_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L007_R2_001.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L008_R1_001.fastq.gz',
-    #              r2='s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273/68HPREL273_S5_L008_R2_001.fastq.gz')]),
-    # FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/160927_K00122_0179_BHFWLKBBXX/3600619798/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/53HPREL160/53HPREL160_S3_L003_R1_001.fastq.gz',
-    #        r2='s3://grail-cfrna-fastq/MissionBay/160927_K00122_0179_BHFWLKBBXX/3600619798/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/53HPREL160/53HPREL160_S3_L003_R2_001.fastq.gz')],
+    # RNASample(
+    #     name="68HPREL273",
+    #     paths=lane_fastq_pairs(
+    #         "s3://grail-cfrna-fastq/MissionBay/161115_E00481_0058_AH53VWALXX/1151367959/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/68HPREL273",
+    #         "68HPREL273_S5",
+    #         range(1, 9),
+    #     ),
+    # ),
     RNASample(
         name="53HPREL160",
-        paths=[
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/53HPREL160_S3_L003_R1_001-00.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/53HPREL160_S3_L003_R2_001-00.fastq.gz",
-            ),
-            FASTQPair(
-                r1="s3://grail-ysaito/af4_benchmark/53HPREL160_S3_L003_R1_001-01.fastq.gz",
-                r2="s3://grail-ysaito/af4_benchmark/53HPREL160_S3_L003_R2_001-01.fastq.gz",
-            ),
-        ],
+        paths=shard_fastq_pairs(SPLIT_FASTQ_DIR, "53HPREL160_S3_L003", 2),
     ),
-    # RNASample(name='117HPREL321', paths=[
-    #     #FASTQPair(r1='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0050_BHF2JCALXX/590215334/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/117HPREL321/117HPREL321_S2_L002_R1_001.fastq.gz',
-    #     #r2='s3://grail-cfrna-fastq/MissionBay/161206_E00501_0050_BHF2JCALXX/590215334/bcl2fastq-2.19.0.316-umi-1mismatch-noignore/117HPREL321/117HPREL321_S2_L002_R2_001.fastq.gz')])
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-00.fastq.gz',
-    #             r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-00.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-01.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-01.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-02.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-02.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-03.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-03.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-04.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-04.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-05.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-05.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-06.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-06.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-07.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-07.fastq.gz'),
-    #     FASTQPair(r1='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R1_001-08.fastq.gz',
-    #              r2='s3://grail-ysaito/af4_benchmark/117HPREL321_S2_L002_R2_001-08.fastq.gz')],
+    # RNASample(
+    #     name="117HPREL321",
+    #     paths=shard_fastq_pairs(SPLIT_FASTQ_DIR, "117HPREL321_S2_L002", 9),
+    # ),
 ]
 
 RNA_BENCHMARK_DIR = f"{BENCHMARK_DATA_DIR}/rna_benchmark"
@@ -704,12 +239,17 @@ BazelLabel = NamedTuple(
 )
 
 
+# "package:target" and "package/target" forms of a bazel label.
+BAZEL_LABEL_RE = re.compile("([^:]+):(.*)$")
+BAZEL_SHORT_LABEL_RE = re.compile("([^:]+)/([^/]+)$")
+
+
 def parse_bazel_label(label: str) -> BazelLabel:
-    m = re.match("([^:]+):(.*)$", label)
+    m = BAZEL_LABEL_RE.match(label)
     if m:
         package, target = m[1], m[2]
     else:
-        m = re.match("([^:]+)/([^/]+)$", label)
+        m = BAZEL_SHORT_LABEL_RE.match(label)
         if not m:
             raise Exception(f"Failed to parse label {label}")
         package = m[0]
@@ -731,14 +271,30 @@ def check_output(args: List[str]) -> str:
     return subprocess.check_output(args, universal_newlines=True)
 
 
+REPO_ROOT: Optional[Path] = None
+
+
 def repo_root() -> Path:
     """Get the root directory of the repository."""
-    commit = check_output(["git", "rev-parse", "--show-toplevel"])
-    return Path(commit.strip())
+    global REPO_ROOT
+    if not REPO_ROOT:
+        commit = check_output(["git", "rev-parse", "--show-toplevel"])
+        REPO_ROOT = Path(commit.strip())
+    return REPO_ROOT
+
+
+# Labels already built by this process.
+BUILT_LABELS: Set[str] = set()
 
 
 def build(labels: List[str]) -> None:
+    """Build the given bazel targets. Targets that have been built by an earlier
+    call are skipped, so callers need not worry about calling it repeatedly."""
+    labels = [label for label in labels if label not in BUILT_LABELS]
+    if not labels:
+        return
     check_call(["bazel", "build"] + labels)
+    BUILT_LABELS.update(labels)
 
 
 def go_executable(label: str) -> Path:
@@ -770,7 +326,6 @@ def grail_file_path() -> Path:
     global GRAIL_FILE_PATH
     if not GRAIL_FILE_PATH:
         target = "//go/src/github.com/grailbio/base/cmd/grail-file"
-        build([target])
         GRAIL_FILE_PATH = go_executable(target)
     return GRAIL_FILE_PATH
 
@@ -783,28 +338,164 @@ def af4_path() -> Path:
     global AF4_PATH
     if not AF4_PATH:
         af4_label = "//go/src/github.com/grailbio/bio/cmd/bio-fusion"
-        build([af4_label])
         AF4_PATH = go_executable(af4_label)
     return AF4_PATH
 
 
-def expand_fastq_files(fq: Iterable[FASTQPair]) -> List[str]:
-    return [x.r1 for x in fq] + [x.r2 for x in fq]
+def cached_fastq_csv(
+    fastq_pairs: Iterable[FASTQPair], cache_dir: str
+) -> Tuple[str, str]:
+    """Return the comma-separated lists of the cached R1 and R2 paths of
+    fastq_pairs, in the form accepted by the af4 -r1 and -r2 flags."""
+    r1: List[str] = []
+    r2: List[str] = []
+    for fp in fastq_pairs:
+        r1.append(f"{cache_dir}/{os.path.basename(fp.r1)}")
+        r2.append(f"{cache_dir}/{os.path.basename(fp.r2)}")
+    return ",".join(r1), ",".join(r2)
 
 
-def s3_cache_files(src_paths: List[str], cache_dir: Path, force=False) -> None:
-    """Copy src_paths in cache_dir if they haven't been copied already."""
-    args = [str(grail_file_path()), "cp", "-v"]
-    n = 0
+def expand_fastq_files(fq: Iterable[FASTQPair]) -> List[str]:
+    """Return the R1 paths of fq followed by its R2 paths. fq is read once, so
+    it may be an iterator."""
+    r1: List[str] = []
+    r2: List[str] = []
+    for x in fq:
+        r1.append(x.r1)
+        r2.append(x.r2)
+    return r1 + r2
+
+
+def s3_cache_files(
+    src_paths: List[str], cache_dir: Path, force=False, parallelism=16
+) -> None:
+    """Copy src_paths in cache_dir if they haven't been copied already.
+
+    The files are split across up to "parallelism" grail-file processes that
+    run concurrently.
+    """
+    missing: List[str] = []
+    # Maps each cached basename to its source, to detect collisions.
+    sources: Dict[str, str] = {}
     for src_path in src_paths:
-        dest_path = str(cache_dir) + "/" + os.path.basename(src_path)
+        basename = os.path.basename(src_path)
+        if basename in sources:
+            if sources[basename] != src_path:
+                raise Exception(
+                    f"{src_path} and {sources[basename]} map to the same cache file"
+                )
+            continue
+        sources[basename] = src_path
+        dest_path = str(cache_dir) + "/" + basename
         if not os.path.exists(dest_path) or force:
-            args.append(src_path)
-            n += 1
-    if n == 0:
+            missing.append(src_path)
+    if not missing:
+        return
+    # The downloads are staged in a temp dir under cache_dir, so it must exist.
+    os.makedirs(cache_dir, exist_ok=True)
+    n_jobs = max(1, min(parallelism, len(missing)))
+    if n_jobs == 1:
+        cache_files_atomically(missing, cache_dir)
         return
-    args.append(str(cache_dir) + "/")
-    check_call(args)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        futures = [
+            executor.submit(cache_files_atomically, missing[i::n_jobs], cache_dir)
+            for i in range(n_jobs)
+        ]
+        for future in futures:
+            future.result()
+
+
+def cache_files_atomically(src_paths: List[str], cache_dir: Path) -> None:
+    """Copy src_paths in cache_dir with one grail-file process. The files are
+    downloaded to a temp dir and then renamed into cache_dir, so that an
+    interrupted copy never leaves a partial file that s3_cache_files would
+    take as cached."""
+    tmp_dir = tempfile.mkdtemp(prefix=".s3_cache_files-", dir=str(cache_dir))
+    try:
+        check_call([str(grail_file_path()), "cp", "-v"] + src_paths + [tmp_dir + "/"])
+        for src_path in src_paths:
+            basename = os.path.basename(src_path)
+            os.replace(f"{tmp_dir}/{basename}", f"{cache_dir}/{basename}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+T = TypeVar("T")
+
+
+def decompress_fastq_files(gz_paths: List[str]) -> List[str]:
+    """Decompress gz_paths in parallel using rapidgzip, or pigz if rapidgzip is
+    not installed. Each file is decompressed in the same directory, with the
+    ".gz" suffix removed. Files that are already decompressed are not touched.
+
+    Returns the list of decompressed paths.
+    """
+    n_threads = str(max(1, (os.cpu_count() or 1) // max(1, len(gz_paths))))
+    # rapidgzip decompresses a single file with multiple threads; pigz uses
+    # its extra threads only for reading, writing and checksumming.
+    if shutil.which("rapidgzip"):
+        cmd = ["rapidgzip", "-d", "-c", "-P", n_threads]
+    else:
+        cmd = ["pigz", "-d", "-c", "-p", n_threads]
+    paths: List[str] = []
+    procs: List[Tuple[subprocess.Popen, str, str]] = []
+    renamed: Set[str] = set()
+    try:
+        for gz_path in gz_paths:
+            if not gz_path.endswith(".gz"):
+                paths.append(gz_path)
+                continue
+            path = gz_path[: -len(".gz")]
+            paths.append(path)
+            if os.path.exists(path):
+                continue
+            tmp_path = path + ".tmp"
+            logging.info("Decompress %s -> %s", gz_path, path)
+            with open(tmp_path, "wb") as out:
+                try:
+                    proc = subprocess.Popen(cmd + [gz_path], stdout=out)
+                except Exception:
+                    os.remove(tmp_path)
+                    raise
+            procs.append((proc, tmp_path, path))
+        for proc, tmp_path, path in procs:
+            if proc.wait() != 0:
+                raise Exception(f"{proc.args}: exit status {proc.returncode}")
+            os.rename(tmp_path, path)
+            renamed.add(tmp_path)
+    finally:
+        # On failure, stop the other decompressors and remove their partial
+        # outputs.
+        for proc, tmp_path, _ in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if tmp_path not in renamed and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return paths
+
+
+def s3_prefetch(
+    items: List[T], files: Callable[[T], List[str]], cache_dir: Path, n_prefetch=1
+) -> Iterator[T]:
+    """Iterate over items, caching files(item) in cache_dir before yielding each
+    item. The files of the next n_prefetch items are downloaded in the
+    background while the caller processes the current one."""
+    grail_file_path()  # build the binary before starting the threads.
+    executor = ThreadPoolExecutor(max_workers=n_prefetch + 1)
+    prefetches: List[Future] = []
+    try:
+        for i, item in enumerate(items):
+            n_prefetches = min(len(items), i + n_prefetch + 1)
+            for next_item in items[len(prefetches) : n_prefetches]:
+                prefetches.append(
+                    executor.submit(s3_cache_files, files(next_item), cache_dir)
+                )
+            prefetches[i].result()
+            yield item
+    finally:
+        executor.shutdown()
 
 
 def s3_cache_dir(src_dir: str, cache_dir: Path) -> None:
@@ -814,6 +505,34 @@ def s3_cache_dir(src_dir: str, cache_dir: Path) -> None:
         logging.error("Error(ignored): %s", e)
 
 
+def cached_parse(path: Path, parser: Callable[[Path], T], cache_dir: str) -> T:
+    """Return parser(path). The result is pickled under cache_dir, keyed on path
+    and on the parser's name. The pickle is reused as long as it is newer than
+    both path and the source file that defines parser, so that editing the
+    parser invalidates it."""
+    src_path = inspect.getsourcefile(parser)
+    if src_path is None:
+        raise Exception(f"{parser}: source file not found")
+    parser_name = Path(src_path).stem + "." + parser.__qualname__
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    cache_path = f"{cache_dir}/parse_cache/{parser_name}/{key}.pkl"
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        if cache_mtime >= max(os.path.getmtime(path), os.path.getmtime(src_path)):
+            with open(cache_path, "rb") as fd:
+                return pickle.load(fd)
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        logging.debug("No usable parse cache for %s: %s", path, e)
+    value = parser(path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Write to a temp file first, since other processes may read the cache.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as fd:
+        pickle.dump(value, fd, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return value
+
+
 RunStats = NamedTuple(
     "RunStats",
     [
@@ -839,6 +558,34 @@ RunStats = NamedTuple(
 )
 
 
+# Matches the timestamp at the start of an INFO log line.
+TIMESTAMP_RE = re.compile(rb"[IEW\d]+ (\d\d+):(\d\d):(\d\d).(\d\d\d\d\d\d)\s+\d+")
+
+# Matches the INFO log messages that run_stats extracts stats from. The kind of
+# the message is given by Match.lastgroup. Every alternative starts with a
+# literal, which lets the regex engine skip quickly over the other lines. The
+# pattern is bytes so that it can run over the mmapped log without decoding it.
+RUN_STATS_RE = re.compile(
+    b"|".join(
+        [
+            rb"Start reading geneDB(?P<start>)",
+            rb"All done(?P<end>)",
+            rb"Processed (?P<n_reads>\d+) reads in",
+            rb"Starting filtering (?P<n_filtering>\d+) candidates",
+            rb"Stats: (?P<n_stage1>\d+) candidates after stage 1",
+            # The "remaining" counters are matched with or without the "Stats:"
+            # prefix, as in older log formats.
+            rb" (?P<n_after_close_proximity>\d+) of \d+ remaining after removing (?P<n_low_complexity>\d+) low-complex substring and (?P<n_close_proximity>\d+) close proximity",
+            rb" (?P<n_after_duplicates>\d+) remaining after removing duplicates",
+            rb" (?P<n_after_min_span>\d+) remaining after filtering by minspan",
+            rb"Wrote (?P<n_wrote>\d+) filtered candidates",  # old log format
+            rb"Stats: (?P<n_final>\d+) final candidates",
+            rb"Stats:.*\{LowComplexity.* Genes:(?P<n_genes>\d+) Fragments:(?P<n_fragments>\d+) FragmentsWithMatchingGenes:\[(?P<n_matches>\d+ \d+ \d+ \d+ \d+)\]",
+        ]
+    )
+)
+
+
 def parse_time(m) -> float:
     """Parse the info log timestamp."""
     return int(m[1]) * 3600 + int(m[2]) * 60 + int(m[3]) + (int(m[4]) / 1000000.0)
@@ -847,10 +594,14 @@ def parse_time(m) -> float:
 def run_stats(dir_path: Path) -> RunStats:
     """Parse the INFO log file produced by bio-target-rna-fusion and extract high-level stats."""
 
-    info_paths = glob.glob(str(dir_path / "*.INFO"))
+    with os.scandir(dir_path) as entries:
+        info_paths = [
+            e.path
+            for e in entries
+            if e.name.endswith(".INFO") and not e.name.startswith(".")
+        ]
     if len(info_paths) != 1:
         raise Exception(f"{dir_path}: No INFO file found ({info_paths})")
-    ts_re = r"[IEW\d]+ (\d\d+):(\d\d):(\d\d).(\d\d\d\d\d\d)\s+\d+.*"
     start_time = 0.0
     end_time = 0.0
     n_fragments = 0
@@ -866,57 +617,45 @@ def run_stats(dir_path: Path) -> RunStats:
     n_fragments2 = -999999
     n_genes = -999999
     n_fragment_matches: List[int] = []
-    with open(info_paths[0]) as fd:
-        for line in fd.readlines():
-            m = re.match(ts_re + r"Start reading geneDB", line)
-            if m:
-                start_time = parse_time(m)
-            m = re.match(ts_re + r"All done", line)
-            if m:
-                end_time = parse_time(m)
-            m = re.match(r".*Processed (\d+) reads in", line)
-            if m:
-                n_fragments += int(m[1])
-            m = re.match(r".*Starting filtering (\d+) candidates", line)
-            if m:
-                all_candidates = int(m[1])
-            m = re.match(r".*Stats: (\d+) candidates after stage 1", line)
-            if m:
-                all_candidates = int(m[1])
-            m = re.match(
-                r".* (\d+) of \d+ remaining after removing (\d+) low-complex substring and (\d+) close proximity",
-                line,
-            )
-            if m:
-                n_remaining_after_close_proximity = int(m[1])
-                low_complexity_substring = int(m[2])
-                close_proximity = int(m[3])
-            m = re.match(r".* (\d+) remaining after removing duplicates", line)
-            if m:
-                n_remaining_after_duplicates = int(m[1])
-            m = re.match(r".* (\d+) remaining after filtering by minspan", line)
-            if m:
-                n_remaining_after_min_span = int(m[1])
-            m = re.match(r".*Wrote (\d+) filtered candidates", line)  # old log format
-            if m:
-                final_candidates = int(m[1])
-            m = re.match(r".*Stats: (\d+) final candidates", line)
-            if m:
-                final_candidates = int(m[1])
-            m = re.match(
-                r".*Stats:.*\{LowComplexity.* Genes:(\d+) Fragments:(\d+) FragmentsWithMatchingGenes:\[(\d+) (\d+) (\d+) (\d+) (\d+)\]",
-                line,
-            )
-            if m:
-                n_genes = int(m[1])
-                n_fragments2 = int(m[2])
-                n_fragment_matches = [
-                    int(m[3]),
-                    int(m[4]),
-                    int(m[5]),
-                    int(m[6]),
-                    int(m[7]),
-                ]
+    with open(info_paths[0], "rb") as fd:
+        # mmap fails on an empty file.
+        if os.fstat(fd.fileno()).st_size > 0:
+            log: Any = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            log = b""
+    for m in RUN_STATS_RE.finditer(log):
+        kind = m.lastgroup
+        if kind == "start" or kind == "end":
+            line_start = log.rfind(b"\n", 0, m.start()) + 1
+            ts = TIMESTAMP_RE.match(log, line_start)
+            if not ts:
+                continue
+            if kind == "start":
+                start_time = parse_time(ts)
+            else:
+                end_time = parse_time(ts)
+        elif kind == "n_reads":
+            n_fragments += int(m["n_reads"])
+        elif kind == "n_filtering":
+            all_candidates = int(m["n_filtering"])
+        elif kind == "n_stage1":
+            all_candidates = int(m["n_stage1"])
+        elif kind == "n_close_proximity":
+            n_remaining_after_close_proximity = int(m["n_after_close_proximity"])
+            low_complexity_substring = int(m["n_low_complexity"])
+            close_proximity = int(m["n_close_proximity"])
+        elif kind == "n_after_duplicates":
+            n_remaining_after_duplicates = int(m["n_after_duplicates"])
+        elif kind == "n_after_min_span":
+            n_remaining_after_min_span = int(m["n_after_min_span"])
+        elif kind == "n_wrote":
+            final_candidates = int(m["n_wrote"])
+        elif kind == "n_final":
+            final_candidates = int(m["n_final"])
+        elif kind == "n_matches":
+            n_genes = int(m["n_genes"])
+            n_fragments2 = int(m["n_fragments"])
+            n_fragment_matches = [int(n) for n in m["n_matches"].split()]
 
     return RunStats(
         duration=(end_time - start_time),
@@ -933,41 +672,57 @@ def run_stats(dir_path: Path) -> RunStats:
     )
 
 
+def run_stats_batch(dir_paths: List[Path]) -> List[RunStats]:
+    """Run run_stats on each of dir_paths in a pool of processes. The results
+    are in the order of dir_paths."""
+    if len(dir_paths) <= 1:
+        return [run_stats(p) for p in dir_paths]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(run_stats, dir_paths))
+
+
+# Maps the sample names in the benchmark result paths to the names used in the
+# paper.
+SAMPLE_NAME_MAP = {
+    "170206_ARTLoD_B1_01rerun": "T1 (0.0001)",
+    "170206_ARTLoD_B1_02rerun": "T2 (0.0002)",
+    "170206_ARTLoD_B1_03rerun": "T3 (0.0002)",
+    "170206_ARTLoD_B1_04rerun": "T4 (0.0004)",
+    "170206_ARTLoD_B1_05rerun": "T5 (0.0004)",
+    "170206_ARTLoD_B1_06rerun": "T6 (0.0004)",
+    "170206_ARTLoD_B1_07rerun": "T7 (0.0006)",
+    "170206_ARTLoD_B1_08rerun": "T8 (0.0006)",
+    "170206_ARTLoD_B1_09rerun": "T9 (0.0006)",
+    "170206_ARTLoD_B1_10rerun": "T10 (0.0008)",
+    "170206_ARTLoD_B1_11rerun": "T11 (0.0008)",
+    "170206_ARTLoD_B1_12rerun": "T12 (0.0008)",
+    "170206_ARTLoD_B1_13rerun": "T13 (0.01)",
+    "170206_ARTLoD_B1_14rerun": "T14 (0.01)",
+    # RNA datasets
+    "101CPREL277": "Prc101",
+    "108CPREL315": "Prc108",
+    "74HPREL332": "HC332",
+    "118HPREL322": "HC118",
+    "68HPREL273": "HC273",  # not used
+    "53HPREL160": "HC160",
+    "117HPREL321": "HC117",  # not used
+}
+
+# Longer keys come first, so that a key that is a prefix of another one can't
+# shadow it.
+SAMPLE_NAME_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(SAMPLE_NAME_MAP, key=len, reverse=True))
+)
+
+
 def pretty_sample_name(path: str) -> str:
     """Given a path of a benchmark result dir,
     return the prettified sample name that's used in the paper.
 
     It returns the path basename by default.
     """
-
-    name_map = {
-        "170206_ARTLoD_B1_01rerun": "T1 (0.0001)",
-        "170206_ARTLoD_B1_02rerun": "T2 (0.0002)",
-        "170206_ARTLoD_B1_03rerun": "T3 (0.0002)",
-        "170206_ARTLoD_B1_04rerun": "T4 (0.0004)",
-        "170206_ARTLoD_B1_05rerun": "T5 (0.0004)",
-        "170206_ARTLoD_B1_06rerun": "T6 (0.0004)",
-        "170206_ARTLoD_B1_07rerun": "T7 (0.0006)",
-        "170206_ARTLoD_B1_08rerun": "T8 (0.0006)",
-        "170206_ARTLoD_B1_09rerun": "T9 (0.0006)",
-        "170206_ARTLoD_B1_10rerun": "T10 (0.0008)",
-        "170206_ARTLoD_B1_11rerun": "T11 (0.0008)",
-        "170206_ARTLoD_B1_12rerun": "T12 (0.0008)",
-        "170206_ARTLoD_B1_13rerun": "T13 (0.01)",
-        "170206_ARTLoD_B1_14rerun": "T14 (0.01)",
-        # RNA datasets
-        "101CPREL277": "Prc101",
-        "108CPREL315": "Prc108",
-        "74HPREL332": "HC332",
-        "118HPREL322": "HC118",
-        "68HPREL273": "HC273",  # not used
-        "53HPREL160": "HC160",
-        "117HPREL321": "HC117",  # not used
-    }
     if path[-1] == "/":
         name = os.path.basename(path[:-1])
     else:
         name = os.path.basename(path)
-    for key, val in name_map.items():
-        name = name.replace(key, val)
-    return name
+    return SAMPLE_NAME_RE.sub(lambda m: SAMPLE_NAME_MAP[m[0]], name)